@@ -60,6 +60,16 @@ final class NoOpImageClassifier: ImageClassifier, ObservableObject {
 @available(macOS 15.0, *)
 final class ImageClassifierImpl: ImageClassifier, ObservableObject {
     private let settingsManager: SettingsManager
+
+    // Vision request to classify an image, built once and reused for every classification.
+    private let classifyRequest = ClassifyImageRequest()
+
+    // Classifications keyed by clipboard item id, so re-showing the same image skips Vision
+    private let classificationCache: NSCache<NSString, CachedClassifications> = {
+        let cache = NSCache<NSString, CachedClassifications>()
+        cache.countLimit = 200
+        return cache
+    }()
     
     init(settingsManager: SettingsManager) {
         self.settingsManager = settingsManager
@@ -75,11 +85,8 @@ final class ImageClassifierImpl: ImageClassifier, ObservableObject {
         let data = try Data(contentsOf: url)
         var image = VisionClassifications()
 
-        // Vision request to classify an image.
-        let request = ClassifyImageRequest()
-
         // Perform the request on the image, and return an array of `ClassificationObservation` objects.
-        let results = try await request.perform(on: data)
+        let results = try await classifyRequest.perform(on: data)
 
         // High-recall approach: Get more classifications (better for clipboard search/discovery)
 //        let filteredResults = results
@@ -105,11 +112,8 @@ final class ImageClassifierImpl: ImageClassifier, ObservableObject {
 
         var image = VisionClassifications()
 
-        // Vision request to classify an image.
-        let request = ClassifyImageRequest()
-
         // Perform the request on the image, and return an array of `ClassificationObservation` objects.
-        let results = try await request.perform(on: data)
+        let results = try await classifyRequest.perform(on: data)
         // Use `hasMinimumPrecision` for a high-recall filter.
             .filter { $0.hasMinimumPrecision(0.1, forRecall: 0.8) }
         // Use `hasMinimumRecall` for a high-precision filter.
@@ -136,16 +140,26 @@ final class ImageClassifierImpl: ImageClassifier, ObservableObject {
             return nil
         }
 
+        // contentHash isn't a digest of the image bytes, so key on the item's identity instead
+        let cacheKey = clipboardItem.id.uuidString as NSString
+        if let cached = classificationCache.object(forKey: cacheKey) {
+            return cached.classifications
+        }
+
         // Perform classification
 
+        let classifications: VisionClassifications
         switch clipboardItem.content {
         case .imageOnDisk:
-            return try await classifyImageOnDiskItem(clipboardItem: clipboardItem)
+            classifications = try await classifyImageOnDiskItem(clipboardItem: clipboardItem)
         case .imageInMemory:
-            return try await classifyImageItem(clipboardItem: clipboardItem)
+            classifications = try await classifyImageItem(clipboardItem: clipboardItem)
         default:
             return nil
         }
+
+        classificationCache.setObject(CachedClassifications(classifications), forKey: cacheKey)
+        return classifications
     }
 
     func batchClassifyItems(
@@ -189,3 +203,12 @@ final class ImageClassifierImpl: ImageClassifier, ObservableObject {
     }
 }
 
+/// Reference wrapper so `VisionClassifications` can be stored in an `NSCache`.
+private final class CachedClassifications {
+    let classifications: VisionClassifications
+
+    init(_ classifications: VisionClassifications) {
+        self.classifications = classifications
+    }
+}
+
@@ -47,6 +47,8 @@ class SettingsManager: ObservableObject {
     
     // MARK: - Private Properties
     private let userDefaults = UserDefaults.standard
+    private let jsonEncoder = JSONEncoder()
+    private let jsonDecoder = JSONDecoder()
     private var isLoading = false
     
     init() {
@@ -83,7 +85,7 @@ class SettingsManager: ObservableObject {
         }
 
         if let excludedAppsData = userDefaults.data(forKey: "excludedApps"),
-           let apps = try? JSONDecoder().decode([String].self, from: excludedAppsData) {
+           let apps = try? jsonDecoder.decode([String].self, from: excludedAppsData) {
             excludedApps = apps
         }
     }
@@ -101,7 +103,7 @@ class SettingsManager: ObservableObject {
         userDefaults.set(enableAIInsights, forKey: "enableAIInsights")
         userDefaults.set(hotkeyModifier.rawValue, forKey: "hotkeyModifier")
 
-        if let excludedAppsData = try? JSONEncoder().encode(excludedApps) {
+        if let excludedAppsData = try? jsonEncoder.encode(excludedApps) {
             userDefaults.set(excludedAppsData, forKey: "excludedApps")
         }
     }
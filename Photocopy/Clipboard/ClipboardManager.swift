@@ -7,6 +7,7 @@
 
 import Foundation
 import AppKit
+import ImageIO
 import SwiftData
 import UserNotifications
 
@@ -39,6 +40,7 @@ class ClipboardManager: ObservableObject {
     private let maxImageSize = 256 * 1024 * 1024 // 256MB per image (absolute limit)
     private let cleanupInterval: TimeInterval = 300 // 5 minutes
     private let maxItemAge: TimeInterval = 7 * 24 * 60 * 60 // 7 days
+    private let maxThumbnailSize: CGFloat = 200 // Longest thumbnail edge, in points
 
     // Disk storage thresholds
     private let diskStorageTextThreshold = 1024 * 1024 // 1MB for text
@@ -402,13 +404,6 @@ class ClipboardManager: ObservableObject {
             return
         }
 
-        // Test if we can create an NSImage from the data
-        if let testImage = NSImage(data: data) {
-            print("📋 Successfully created NSImage with size: \(testImage.size)")
-        } else {
-            print("📋 ⚠️ Failed to create NSImage from data")
-        }
-
         // Generate thumbnail and get image info
         let (thumbnailData, imageInfo) = generateImageThumbnail(from: data)
 
@@ -432,13 +427,17 @@ class ClipboardManager: ObservableObject {
     }
     
     private func generateImageThumbnail(from imageData: Data) -> (Data?, String) {
+        // Formats ImageIO can decode are downsampled while decoding; others (e.g. PDF) go through NSImage
+        if let downsampled = generateDownsampledThumbnail(from: imageData) {
+            return downsampled
+        }
+
         guard let nsImage = NSImage(data: imageData) else {
             print("📋 ⚠️ Failed to create NSImage for thumbnail generation")
             return (nil, "")
         }
         
         let originalSize = nsImage.size
-        let maxThumbnailSize: CGFloat = 200
         
         print("📋 Generating thumbnail for image: \(Int(originalSize.width))×\(Int(originalSize.height))")
         
@@ -473,6 +472,64 @@ class ClipboardManager: ObservableObject {
         let imageInfo = "\(Int(originalSize.width))×\(Int(originalSize.height))"
         return (thumbnailData, imageInfo)
     }
+
+    /// Decodes the image straight to thumbnail size with ImageIO, so the full-resolution bitmap
+    /// is never materialized. Returns nil when ImageIO can't read the data. The reported size is
+    /// in points, like `NSImage.size`, so it matches the NSImage fallback.
+    private func generateDownsampledThumbnail(from imageData: Data) -> (Data?, String)? {
+        guard let source = CGImageSourceCreateWithData(imageData as CFData, nil),
+              let properties = CGImageSourceCopyPropertiesAtIndex(source, 0, nil) as? [CFString: Any],
+              let pointSize = Self.pointSize(fromImageProperties: properties) else {
+            return nil
+        }
+
+        let scaleFactor = NSScreen.main?.backingScaleFactor ?? 2
+        let options: [CFString: Any] = [
+            kCGImageSourceCreateThumbnailFromImageAlways: true,
+            kCGImageSourceCreateThumbnailWithTransform: true,
+            kCGImageSourceShouldCacheImmediately: true,
+            kCGImageSourceThumbnailMaxPixelSize: Int(maxThumbnailSize * scaleFactor)
+        ]
+
+        guard let thumbnail = CGImageSourceCreateThumbnailAtIndex(source, 0, options as CFDictionary),
+              let thumbnailData = NSBitmapImageRep(cgImage: thumbnail).representation(using: .png, properties: [:]) else {
+            print("📋 ⚠️ Failed to generate downsampled thumbnail")
+            return nil
+        }
+
+        print("📋 ✅ Successfully generated thumbnail: \(thumbnail.width)×\(thumbnail.height)")
+
+        return (thumbnailData, "\(pointSize.width)×\(pointSize.height)")
+    }
+
+    /// Image size in points from ImageIO properties, converting pixels with the image's DPI
+    /// the way `NSImage.size` does (72 DPI is 1pt per pixel). The size is reported upright,
+    /// matching the thumbnail, which has the EXIF orientation applied.
+    nonisolated static func pointSize(fromImageProperties properties: [CFString: Any]) -> (width: Int, height: Int)? {
+        guard let pixelWidth = properties[kCGImagePropertyPixelWidth] as? Int,
+              let pixelHeight = properties[kCGImagePropertyPixelHeight] as? Int else {
+            return nil
+        }
+
+        let width = points(fromPixels: pixelWidth, dpi: properties[kCGImagePropertyDPIWidth] as? Double)
+        let height = points(fromPixels: pixelHeight, dpi: properties[kCGImagePropertyDPIHeight] as? Double)
+
+        // Orientations 5...8 rotate the image by 90°, swapping its width and height
+        let orientation = properties[kCGImagePropertyOrientation] as? Int ?? 1
+        if (5...8).contains(orientation) {
+            return (width: height, height: width)
+        }
+        return (width: width, height: height)
+    }
+
+    /// Malformed metadata can report a DPI of 0, NaN or infinity, which would make `Int(_:)` trap,
+    /// so anything that isn't a finite DPI of at least 1 is treated as 72.
+    private nonisolated static func points(fromPixels pixels: Int, dpi: Double?) -> Int {
+        guard let dpi = dpi, dpi.isFinite, dpi >= 1 else {
+            return pixels
+        }
+        return Int(Double(pixels) * 72 / dpi)
+    }
     
     private func processFileContent(_ fileURLs: [String], modelContext: ModelContext) {
         print("📋 🔧 processFileContent called with URLs: \(fileURLs)")
@@ -524,12 +581,7 @@ class ClipboardManager: ObservableObject {
         print("📋 🖼️ processImageFile called with URL: \(url)")
         print("📋 URL path: \(url.path)")
         print("📋 URL absoluteString: \(url.absoluteString)")
-        print("📋 File exists: \(FileManager.default.fileExists(atPath: url.path))")
-        
-        // Check if file is readable
-        let isReadable = FileManager.default.isReadableFile(atPath: url.path)
-        print("📋 File is readable: \(isReadable)")
-        
+
         // Try using NSImage directly first (it might handle file access better)
         if let nsImage = NSImage(contentsOf: url) {
             print("📋 ✅ Successfully loaded NSImage directly from URL")
@@ -674,9 +726,7 @@ class ClipboardManager: ObservableObject {
         var preview = "HTML content"
         if let htmlString = String(data: htmlData, encoding: .utf8) {
             // Simple HTML tag removal for preview
-            let plainText = htmlString.replacingOccurrences(of: "<[^>]+>", with: "", options: .regularExpression)
-                .trimmingCharacters(in: .whitespacesAndNewlines)
-            preview = String(plainText.prefix(200))
+            preview = Self.plainTextPreview(fromHTML: htmlString, limit: 200)
         }
 
         // Use smart storage strategy for HTML content (treated as rich text)
@@ -879,12 +929,17 @@ class ClipboardManager: ObservableObject {
             }
         case .image:
             if let imageData = item.fullImageData {  // Use original image data for pasting
-                // Try to set as PNG first for better quality
-                if let nsImage = NSImage(data: imageData),
-                   let tiffData = nsImage.tiffRepresentation,
-                   let bitmapRep = NSBitmapImageRep(data: tiffData),
+                // Try to set as PNG first for better quality, decoding bitmap data directly
+                // instead of round-tripping it through NSImage and TIFF
+                if let bitmapRep = NSBitmapImageRep(data: imageData),
                    let pngData = bitmapRep.representation(using: .png, properties: [:]) {
                     pasteboard.setData(pngData, forType: .png)
+                } else if let nsImage = NSImage(data: imageData),
+                          let tiffData = nsImage.tiffRepresentation,
+                          let bitmapRep = NSBitmapImageRep(data: tiffData),
+                          let pngData = bitmapRep.representation(using: .png, properties: [:]) {
+                    // Non-bitmap sources such as PDF need NSImage to rasterize them
+                    pasteboard.setData(pngData, forType: .png)
                 } else {
                     // Fallback to TIFF if PNG conversion fails
                     pasteboard.setData(imageData, forType: .tiff)
@@ -1074,9 +1129,12 @@ class ClipboardManager: ObservableObject {
         return ["http", "https", "ftp", "file", "mailto", "tel", "sms"].contains(scheme)
     }
     
+    // Compiled once instead of on every text clipboard change
+    private static let emailRegex = try! NSRegularExpression(pattern: #"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$"#)
+
     private func isEmail(_ text: String) -> Bool {
-        let emailRegex = #"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$"#
-        return text.range(of: emailRegex, options: .regularExpression) != nil
+        let range = NSRange(text.startIndex..., in: text)
+        return Self.emailRegex.firstMatch(in: text, range: range) != nil
     }
     
     private func isPhoneNumber(_ text: String) -> Bool {
@@ -1085,6 +1143,42 @@ class ClipboardManager: ObservableObject {
         return cleanedText.range(of: phoneRegex, options: .regularExpression) != nil && cleanedText.count >= 7
     }
     
+    /// Strips HTML tags in a single forward pass, stopping once `limit` characters of text
+    /// have been collected so large documents aren't scanned in full just for a preview.
+    /// Whitespace is trimmed from both ends of the collected text, including at the cut point.
+    nonisolated static func plainTextPreview(fromHTML html: String, limit: Int) -> String {
+        var text = ""
+        var textCount = 0
+        var hasClosingBracket = true
+        var index = html.startIndex
+
+        while index < html.endIndex && textCount < limit {
+            let character = html[index]
+            let nextIndex = html.index(after: index)
+
+            // A tag is "<" followed by at least one character before the next ">"
+            if character == "<" && hasClosingBracket {
+                if let closingIndex = html[nextIndex...].firstIndex(of: ">") {
+                    if closingIndex > nextIndex {
+                        index = html.index(after: closingIndex)
+                        continue
+                    }
+                } else {
+                    hasClosingBracket = false
+                }
+            }
+
+            // Skip leading whitespace so it doesn't count towards the limit
+            if !(textCount == 0 && character.isWhitespace) {
+                text.append(character)
+                textCount += 1
+            }
+            index = nextIndex
+        }
+
+        return text.trimmingCharacters(in: .whitespacesAndNewlines)
+    }
+
     // MARK: - Search Functionality
     
     func filterItems() {
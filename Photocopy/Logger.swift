@@ -26,10 +26,14 @@ final class ApplicationLogger {
             case error = "ERROR"
         }
 
-        var formattedTimestamp: String {
+        private static let timestampFormatter: DateFormatter = {
             let formatter = DateFormatter()
             formatter.dateFormat = "HH:mm:ss.SSS"
-            return formatter.string(from: timestamp)
+            return formatter
+        }()
+
+        var formattedTimestamp: String {
+            Self.timestampFormatter.string(from: timestamp)
         }
     }
 
@@ -247,6 +247,11 @@ struct ClipboardItemCard<T: ObservableObject & ImageClassifier>: View, Equatable
     // MARK: - AI Insights Methods
     
     private func generateAIInsights() {
+        // A classification for this item is already in flight, don't run it twice
+        guard !isGeneratingAIInsights else {
+            return
+        }
+
         guard #available(macOS 15.0, *) else {
             print("❌ AI Insights require macOS 15.0+")
             return
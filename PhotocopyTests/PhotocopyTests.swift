@@ -6,6 +6,7 @@
 //
 
 import Testing
+import ImageIO
 @testable import Photocopy
 
 struct PhotocopyTests {
@@ -14,4 +15,107 @@ struct PhotocopyTests {
         // Write your test here and use APIs like `#expect(...)` to check expected conditions.
     }
 
+    // MARK: - HTML Preview
+
+    @Test func htmlPreviewStripsTags() {
+        let preview = ClipboardManager.plainTextPreview(fromHTML: "<p>Hello <b>world</b></p>", limit: 200)
+        #expect(preview == "Hello world")
+    }
+
+    @Test func htmlPreviewKeepsEmptyAngleBrackets() {
+        // "<[^>]+>" needs at least one character between the brackets
+        let preview = ClipboardManager.plainTextPreview(fromHTML: "<p>a<>b</p>", limit: 200)
+        #expect(preview == "a<>b")
+    }
+
+    @Test func htmlPreviewKeepsUnterminatedOpeningBracket() {
+        // With no ">" after it, a "<" can't start a tag
+        let preview = ClipboardManager.plainTextPreview(fromHTML: "<p>a</p> b < c", limit: 200)
+        #expect(preview == "a b < c")
+    }
+
+    @Test func htmlPreviewSkipsLeadingWhitespaceAndKeepsWhitespaceBetweenTags() {
+        let html = "  \n<div>  <p> Hello </p>\n<p>world</p>  </div> "
+        let preview = ClipboardManager.plainTextPreview(fromHTML: html, limit: 200)
+        #expect(preview == "Hello \nworld")
+    }
+
+    @Test func htmlPreviewTruncatesAtLimit() {
+        let html = "<p>" + String(repeating: "a", count: 300) + "</p>"
+        let preview = ClipboardManager.plainTextPreview(fromHTML: html, limit: 200)
+        #expect(preview == String(repeating: "a", count: 200))
+    }
+
+    @Test func htmlPreviewTrimsTrailingWhitespaceAtCutPoint() {
+        let preview = ClipboardManager.plainTextPreview(fromHTML: "<p>abc   </p><p>def</p>", limit: 5)
+        #expect(preview == "abc")
+    }
+
+    // MARK: - Image Point Size
+
+    @Test func imagePointSizeConvertsPixelsWithDPI() {
+        let size = ClipboardManager.pointSize(fromImageProperties: [
+            kCGImagePropertyPixelWidth: 2880,
+            kCGImagePropertyPixelHeight: 1800,
+            kCGImagePropertyDPIWidth: 144.0,
+            kCGImagePropertyDPIHeight: 144.0
+        ])
+        #expect(size?.width == 1440)
+        #expect(size?.height == 900)
+    }
+
+    @Test func imagePointSizeDefaultsToSeventyTwoDPI() {
+        let size = ClipboardManager.pointSize(fromImageProperties: [
+            kCGImagePropertyPixelWidth: 640,
+            kCGImagePropertyPixelHeight: 480
+        ])
+        #expect(size?.width == 640)
+        #expect(size?.height == 480)
+    }
+
+    @Test func imagePointSizeIgnoresInvalidDPI() {
+        // Zero or non-finite DPI must not trap when converting to Int
+        for dpi in [0.0, -72.0, .infinity, .nan] {
+            let size = ClipboardManager.pointSize(fromImageProperties: [
+                kCGImagePropertyPixelWidth: 640,
+                kCGImagePropertyPixelHeight: 480,
+                kCGImagePropertyDPIWidth: dpi,
+                kCGImagePropertyDPIHeight: dpi
+            ])
+            #expect(size?.width == 640)
+            #expect(size?.height == 480)
+        }
+    }
+
+    @Test func imagePointSizeSwapsDimensionsForRotatedOrientations() {
+        // A portrait phone photo is stored landscape with a rotating EXIF orientation
+        for orientation in 5...8 {
+            let size = ClipboardManager.pointSize(fromImageProperties: [
+                kCGImagePropertyPixelWidth: 4032,
+                kCGImagePropertyPixelHeight: 3024,
+                kCGImagePropertyDPIWidth: 72.0,
+                kCGImagePropertyDPIHeight: 144.0,
+                kCGImagePropertyOrientation: orientation
+            ])
+            #expect(size?.width == 1512)
+            #expect(size?.height == 4032)
+        }
+    }
+
+    @Test func imagePointSizeKeepsDimensionsForUnrotatedOrientations() {
+        for orientation in 1...4 {
+            let size = ClipboardManager.pointSize(fromImageProperties: [
+                kCGImagePropertyPixelWidth: 4032,
+                kCGImagePropertyPixelHeight: 3024,
+                kCGImagePropertyOrientation: orientation
+            ])
+            #expect(size?.width == 4032)
+            #expect(size?.height == 3024)
+        }
+    }
+
+    @Test func imagePointSizeRequiresPixelDimensions() {
+        #expect(ClipboardManager.pointSize(fromImageProperties: [:]) == nil)
+    }
+
 }